@@ -0,0 +1,131 @@
+"""
+Runtime Support Module
+
+Event-loop runner and optional-dependency shims shared by ptovnetlab's
+modules.  ptovnetlab runs on its core dependencies alone; the packages in
+the 'fast' extra (orjson, uvloop, aiodns) are used from here when they are
+installed.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Any, Coroutine, Iterator, Optional, TypeVar
+
+import aiohttp
+from aiohttp.abc import AbstractResolver
+
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Run event loops on uvloop when it is installed; uvloop.run() only exists
+# from uvloop 0.18, so an older uvloop falls back to asyncio.run()
+_run = getattr(uvloop, 'run', None) or asyncio.run
+
+_T = TypeVar('_T')
+
+def run_event_loop(coro: Coroutine[Any, Any, _T]) -> _T:
+    """
+    Run a coroutine to completion on a new event loop.
+
+    The loop is uvloop's when uvloop is installed, new tasks on it run their
+    first step eagerly (Python 3.12+), and log output is written from a
+    background thread while it runs (see _queued_logging).  Only this new
+    loop is set up that way; coroutines awaited from a caller's own loop
+    leave it untouched.
+
+    Args:
+        coro (Coroutine): Coroutine to run, e.g. main_job(...)
+
+    Returns:
+        The coroutine's result
+    """
+    with _queued_logging():
+        return _run(_with_eager_tasks(coro))
+
+async def _with_eager_tasks(coro: Coroutine[Any, Any, _T]) -> _T:
+    """
+    Await a coroutine with the eager task factory installed on its loop.
+
+    Args:
+        coro (Coroutine): Coroutine to await
+
+    Returns:
+        The coroutine's result
+    """
+    if hasattr(asyncio, 'eager_task_factory'):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    return await coro
+
+@contextlib.contextmanager
+def _queued_logging() -> Iterator[None]:
+    """
+    Hand log records to the root logger's handlers on a background thread.
+
+    While active, the root logger's only handler is a QueueHandler, so a log
+    call made from the event loop just enqueues its record; a QueueListener
+    thread does the stream writes and flushes with the original handlers.
+
+    Yields:
+        None
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    if not handlers:
+        yield
+        return
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    try:
+        yield
+    finally:
+        # Stopping the listener flushes any records still queued
+        listener.stop()
+        root.handlers = handlers
+
+def make_resolver() -> Optional[AbstractResolver]:
+    """
+    Create the DNS resolver for an aiohttp connector.
+
+    Hostnames are resolved through aiodns (c-ares) when it is installed,
+    rather than with getaddrinfo() in the event loop's thread pool.  aiodns
+    does not work with the Proactor event loop that Windows uses by default,
+    so Windows always gets aiohttp's default resolver.
+
+    Returns:
+        Optional[AbstractResolver]: An AsyncResolver, or None for
+        aiohttp's default resolver
+    """
+    if aiodns is None or sys.platform == 'win32':
+        return None
+    return aiohttp.AsyncResolver()
+
+# Use orjson for request and response bodies when it is installed
+if orjson is not None:
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+    json_loads = orjson.loads
+else:
+    json_dumps = json.dumps
+    json_loads = json.loads
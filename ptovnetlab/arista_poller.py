@@ -3,16 +3,19 @@
 Arista Network Device Polling Module
 
 This module provides asynchronous functionality for polling multiple Arista 
-network switches concurrently using pyeapi, extracting device information 
-and LLDP connection details.
+network switches concurrently over eAPI (JSON-RPC over HTTPS), extracting 
+device information and LLDP connection details.
 """
 
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple
 
-import pyeapi
+import aiohttp
+
+from ptovnetlab._runtime import (
+    json_dumps, json_loads, make_resolver, run_event_loop
+)
 from ptovnetlab.data_classes import Switch, Connection
 
 # Configure logging
@@ -22,34 +25,69 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Upper bound on simultaneous eAPI connections across all switches
+EAPI_CONNECTION_LIMIT = 50
+
 class AristaPollerError(Exception):
     """Custom exception for Arista Poller related errors."""
     pass
 
-def validate_switch_credentials(switch: str, username: str, password: str) -> bool:
+async def run_cmds(
+    session: aiohttp.ClientSession,
+    switch: str,
+    cmds: List[str],
+    fmt: str = 'json'
+) -> List[Dict[str, Any]]:
+    """
+    Run privileged-mode commands on a switch with a single eAPI runCmds call.
+
+    Args:
+        session (aiohttp.ClientSession): Session carrying the eAPI credentials
+        switch (str): Switch hostname or IP address
+        cmds (List[str]): Commands to run, in order
+        fmt (str): eAPI output format for every command, 'json' or 'text'
+
+    Returns:
+        List[Dict[str, Any]]: Result of each command, in order; with 'text'
+        each result holds the command's output under 'output'
+
+    Raises:
+        AristaPollerError: If the switch returns a JSON-RPC error
+    """
+    request = {
+        "jsonrpc": "2.0",
+        "method": "runCmds",
+        "params": {"version": 1, "cmds": ["enable", *cmds], "format": fmt},
+        "id": switch
+    }
+    async with session.post(f"https://{switch}/command-api", json=request) as response:
+        response.raise_for_status()
+        reply = await response.json(loads=json_loads, content_type=None)
+
+    if "error" in reply:
+        raise AristaPollerError(
+            f"eAPI error from {switch}: {reply['error'].get('message')}"
+        )
+    # Drop the result of the leading 'enable'
+    return reply["result"][1:]
+
+async def validate_switch_credentials(
+    session: aiohttp.ClientSession,
+    switch: str
+) -> bool:
     """
     Validate switch connection credentials.
 
     Args:
+        session (aiohttp.ClientSession): Session carrying the eAPI credentials
         switch (str): Switch hostname or IP address
-        username (str): Authentication username
-        password (str): Authentication password
 
     Returns:
         bool: True if credentials are valid, False otherwise
     """
     try:
-        pyeapi.client.config.clear()
-        pyeapi.client.config.add_connection(
-            switch, 
-            host=switch, 
-            transport='https',
-            username=username, 
-            password=password
-        )
-        node = pyeapi.connect_to(switch)
         # Attempt a simple command to verify connection
-        node.enable("show version")
+        await run_cmds(session, switch, ["show version"])
         return True
     except Exception as e:
         logger.error(f"Credential validation failed for {switch}: {e}")
@@ -74,17 +112,8 @@ def invoker(
         Tuple[List[Switch], List[Connection]]: Polled switches and their connections
     """
     try:
-        # Validate credentials for all switches before polling
-        valid_switches = [
-            switch for switch in switchlist_in 
-            if validate_switch_credentials(switch, uname_in, passwd_in)
-        ]
-
-        if not valid_switches:
-            raise AristaPollerError("No valid switches found for polling")
-
-        switches, connections = asyncio.run(
-            main(valid_switches, uname_in, passwd_in, runtype_in)
+        switches, connections = run_event_loop(
+            main(switchlist_in, uname_in, passwd_in, runtype_in)
         )
         return switches, connections
     except Exception as e:
@@ -100,6 +129,9 @@ async def main(
     """
     Asynchronously poll multiple Arista switches.
 
+    All switches are polled from one aiohttp.ClientSession, so no worker
+    threads are needed and connections are pooled across the run.
+
     Args:
         switchlist_in2 (List[str]): Switches to poll
         uname_in2 (str): Authentication username
@@ -109,112 +141,119 @@ async def main(
     Returns:
         Tuple[List[Switch], List[Connection]]: Polled switches and their connections
     """
-    # Set the maximum number of worker threads
-    loop = asyncio.get_running_loop()
-    loop.set_default_executor(ThreadPoolExecutor(max_workers=20))
-    
-    logger.info(f'Polling {len(switchlist_in2)} Arista switches via EOS API...')
-    
-    # Create tasks for each switch
-    tasks = [
-        asyncio.create_task(
-            asyncio.to_thread(
-                get_sw_data, 
-                switch, 
-                uname_in2, 
-                passwd_in2, 
-                sw_index
+    # eAPI listens on self-signed certificates, so skip verification.  Each
+    # switch is a separate hostname, so resolve them through aiodns instead
+    # of the thread pool when it is installed.
+    connector = aiohttp.TCPConnector(
+        limit=EAPI_CONNECTION_LIMIT,
+        ssl=False,
+        resolver=make_resolver()
+    )
+    async with aiohttp.ClientSession(
+        connector=connector,
+        auth=aiohttp.BasicAuth(uname_in2, passwd_in2),
+        json_serialize=json_dumps
+    ) as session:
+        # Validate credentials for all switches before polling
+        validity = await asyncio.gather(
+            *(validate_switch_credentials(session, switch) for switch in switchlist_in2)
+        )
+        valid_switches = [
+            switch for switch, valid in zip(switchlist_in2, validity) if valid
+        ]
+
+        if not valid_switches:
+            raise AristaPollerError("No valid switches found for polling")
+
+        logger.info(f'Polling {len(valid_switches)} Arista switches via EOS API...')
+
+        # Gather the data from all EAPI polling requests
+        try:
+            answers = await asyncio.gather(
+                *(
+                    get_sw_data(session, switch, sw_index)
+                    for sw_index, switch in enumerate(valid_switches)
+                )
             )
-        ) 
-        for sw_index, switch in enumerate(switchlist_in2)
-    ]
+            logger.info('Finished polling switches.')
 
-    # Gather the data from all EAPI polling threads
-    try:
-        answers = await asyncio.gather(*tasks)
-        logger.info('Finished polling switches.')
-
-        switches = []
-        connections = []
-        
-        # Process the gathered data
-        for val in answers:
-            switch, lldp_connections = val
-            switches.append(switch)
-            connections.extend(lldp_connections)
+            switches = []
+            connections = []
 
-        return switches, connections
+            # Process the gathered data
+            for val in answers:
+                switch, lldp_connections = val
+                switches.append(switch)
+                connections.extend(lldp_connections)
 
-    except Exception as e:
-        logger.error(f"Error during switch polling: {e}")
-        raise AristaPollerError(f"Switch polling failed: {e}")
+            return switches, connections
+
+        except Exception as e:
+            logger.error(f"Error during switch polling: {e}")
+            raise AristaPollerError(f"Switch polling failed: {e}")
 
-def get_sw_data(
+async def get_sw_data(
+    session: aiohttp.ClientSession,
     switch3: str, 
-    uname_in3: str, 
-    passwd_in3: str, 
     sw_cntr3_in: int
 ) -> Tuple[Switch, List[Connection]]:
     """
-    Retrieve switch data and LLDP connections for a single switch.  Uses async_io.to_thread to 
-    achieve non-blocking concurrent polling of multiple switches.  to_thread is required due to 
-    our use of the pyeapi library, which relies on the synchronous requests library.
+    Retrieve switch data and LLDP connections for a single switch.
 
     Args:
+        session (aiohttp.ClientSession): Session carrying the eAPI credentials
         switch3 (str): Switch hostname or IP to interrogate
-        uname_in3 (str): Authentication username
-        passwd_in3 (str): Authentication password
         sw_cntr3_in (int): Switch index for logging purposes
 
     Returns:
         Tuple[Switch, List[Connection]]: Switch object and its LLDP connections
     """
     try:
-        # Clear any existing pyeapi.client.config
-        pyeapi.client.config.clear()
-        
-        # Build the pyeapi.client.config object
-        pyeapi.client.config.add_connection(
-            switch3, 
-            host=switch3, 
-            transport='https',
-            username=uname_in3, 
-            password=passwd_in3
-        )
-        
-        # Connect to the switch
-        node = pyeapi.connect_to(switch3)
-        
-        # Get JSON-formatted results of several 'show...' commands
-        eos_output = node.enable(
-            ("show version", "show lldp neighbors", "show lldp local-info"), 
-            format="json"
-        )
-        
+        # Run all 'show...' commands in one text-format eAPI request; the
+        # running-config is kept verbatim (heredoc banners, in-section '!'
+        # lines) and the others are piped through '| json'
+        outputs = [
+            result["output"]
+            for result in await run_cmds(
+                session,
+                switch3,
+                [
+                    "show version | json",
+                    "show lldp neighbors | json",
+                    "show lldp local-info | json",
+                    "show running-config all"
+                ],
+                fmt='text'
+            )
+        ]
+        eos_output = [json_loads(output) for output in outputs[:3]]
+        lldp_system_name = str(eos_output[2]["systemName"])
+
         # Create Switch object
         switch = Switch(
             name=switch3,
-            model=eos_output[0]["result"]["modelName"],
-            eos_version=eos_output[0]["result"]["version"],
-            system_mac=eos_output[0]["result"]["systemMacAddress"],
-            serial_number=eos_output[0]["result"]["serialNumber"],
-            lldp_system_name=eos_output[2]["result"]["systemName"],
+            model=eos_output[0]["modelName"],
+            eos_version=eos_output[0]["version"],
+            system_mac=eos_output[0]["systemMacAddress"],
+            serial_number=eos_output[0]["serialNumber"],
+            lldp_system_name=lldp_system_name,
             ethernet_interfaces=0,  # Will be set by arista_sanitizer
             gns3_template_id='',   # Will be set by gns3_worker
             gns3_node_id='',       # Will be set by gns3_worker
             docker_container_id='', # Will be set by gns3_worker
-            initial_config=node.running_config.splitlines()
+            initial_config=outputs[3].splitlines()
         )
 
         # Create Connection objects from LLDP neighbors
+        lldp_neighbors = eos_output[1]["lldpNeighbors"]
         connections = [
             Connection(
-                switch_a=str(eos_output[2]["result"]["systemName"]),
+                switch_a=lldp_system_name,
                 port_a=str(value["port"]),
                 switch_b=str(value["neighborDevice"]),
                 port_b=str(value["neighborPort"])
             )
-            for value in eos_output[1]["result"]["lldpNeighbors"]
+            for value in lldp_neighbors
         ]
 
         logger.info(f"Finished polling switch: {switch3}")
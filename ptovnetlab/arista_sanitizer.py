@@ -8,7 +8,8 @@ lab environment.
 """
 
 import logging
-from typing import List, Optional
+import re
+from typing import List, Tuple
 
 from ptovnetlab.data_classes import Switch
 
@@ -19,6 +20,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Configuration lines to be commented out in cEOS lab environment
+BAD_STARTS = (
+    'radius', 'username', 'aaa', 'ip radius', 'hardware speed',
+    'queue', 'server ', 'ntp server', 'daemon TerminAttr',
+    '   exec /usr/bin/TerminAttr'
+)
+_BAD_STARTS_RE = re.compile(
+    '^(?:' + '|'.join(map(re.escape, BAD_STARTS)) + ')', re.MULTILINE
+)
+# 'interface Ethernet...' header together with its indented section body
+_ETHER_SECTION_RE = re.compile(
+    r'^interface Ethernet(?P<port>[^/\s]*)(?P<suffix>/\S*)?$'
+    r'(?P<body>(?:\n[ \t].*)*)',
+    re.MULTILINE
+)
+# Breakout lanes with no cEOS equivalent
+_BREAKOUT_SUFFIXES = ('/2', '/3', '/4')
+
 class EosSanitizerError(Exception):
     """Custom exception for EOS to cEOS configuration sanitization errors."""
     pass
@@ -45,20 +64,9 @@ def eos_to_ceos(switch: Switch) -> Switch:
         if not switch or not switch.initial_config:
             raise EosSanitizerError("Invalid switch configuration: Empty config")
 
-        # Configuration lines to be commented out in cEOS lab environment
-        bad_starts = [
-            'radius', 'username', 'aaa', 'ip radius', 'hardware speed', 
-            'queue', 'server ', 'ntp server', 'daemon TerminAttr', 
-            '   exec /usr/bin/TerminAttr'
-        ]
-
-        # Count Ethernet interfaces
-        switch.ethernet_interfaces = _count_ether_interfaces(switch.initial_config)
-
-        # Process configuration lines
-        sanitized_config = _sanitize_config_lines(
+        # Process configuration lines, counting Ethernet interfaces on the way
+        sanitized_config, switch.ethernet_interfaces = _sanitize_config_lines(
             switch.initial_config, 
-            bad_starts, 
             switch.system_mac
         )
 
@@ -74,63 +82,48 @@ def eos_to_ceos(switch: Switch) -> Switch:
 
 def _sanitize_config_lines(
     config_lines: List[str], 
-    bad_starts: List[str], 
     system_mac: str
-) -> List[str]:
+) -> Tuple[List[str], int]:
     """
     Sanitize configuration lines for cEOS compatibility.
 
+    The config is joined into one string so that each rewrite is a single
+    pass of a precompiled regex rather than a Python loop over every line.
+    Ethernet interfaces are counted during the same pass that rewrites them.
+
     Args:
         config_lines (List[str]): Original configuration lines
-        bad_starts (List[str]): Prefixes of lines to be commented out
         system_mac (str): System MAC address to be applied
 
     Returns:
-        List[str]: Sanitized configuration lines
+        Tuple[List[str], int]: Sanitized configuration lines and the number
+            of Ethernet interfaces kept in them
     """
-    sanitized_lines = []
-    mgt_port_str = 'Management0'
-
-    for line in config_lines:
-        # Replace Management1/Management0 interface names
-        line = line.replace('Management1', mgt_port_str)
-        line = line.replace('Management0', mgt_port_str)
+    ether_count = 0
 
-        # Comment out lines starting with bad prefixes
-        if any(line.startswith(bad) for bad in bad_starts):
-            line = f"!removed_for_cEOS-lab| {line}"
+    def rewrite_ether_section(match: re.Match) -> str:
+        nonlocal ether_count
+        suffix = match['suffix']
+        # Remove breakout interfaces (/2, /3, /4), commenting out their whole section
+        if suffix and suffix.endswith(_BREAKOUT_SUFFIXES):
+            return '!' + match.group(0).replace('\n', '\n!')
+        # Simplify interface names (remove subinterface)
+        ether_count += 1
+        return f"interface Ethernet{match['port']}{match['body']}"
 
-        # Handle spurious interface configurations
-        if line.startswith('interface Ethernet'):
-            # Remove breakout interfaces (/2, /3, /4)
-            if any(f'/{n}' in line for n in [2, 3, 4]):
-                line = f"!{line}"
-            # Simplify interface names (remove subinterface)
-            else:
-                line = line.split('/')[0]
+    config_text = '\n'.join(config_lines)
 
-        sanitized_lines.append(line)
+    # Replace Management1 interface names with Management0
+    config_text = config_text.replace('Management1', 'Management0')
 
-    # Apply system MAC address configuration
-    sanitized_lines = _apply_sys_mac(sanitized_lines, system_mac)
-
-    return sanitized_lines
-
-def _count_ether_interfaces(config: List[str]) -> int:
-    """
-    Count the number of Ethernet interfaces in the configuration.
+    # Comment out lines starting with bad prefixes
+    config_text = _BAD_STARTS_RE.sub(r'!removed_for_cEOS-lab| \g<0>', config_text)
 
-    Args:
-        config (List[str]): List of configuration lines
+    # Handle Ethernet interface sections
+    config_text = _ETHER_SECTION_RE.sub(rewrite_ether_section, config_text)
 
-    Returns:
-        int: Number of Ethernet interfaces
-    """
-    return sum(
-        1 for line in config 
-        if (line.startswith('interface Ethernet') and 
-            not any(line.endswith(f'/{n}') for n in [2, 3, 4]))
-    )
+    # Apply system MAC address configuration
+    return _apply_sys_mac(config_text.split('\n'), system_mac), ether_count
 
 def _apply_sys_mac(config: List[str], sys_mac: str) -> List[str]:
     """
@@ -155,10 +148,8 @@ def _apply_sys_mac(config: List[str], sys_mac: str) -> List[str]:
         '  EOF'
     ]
 
-    # Remove the last line ('end') and append system MAC config
+    # Insert the system MAC config just before the last line ('end')
     if config and config[-1] == 'end':
-        config.pop()
-        config.extend(sys_mac_snippet)
-        config.append('end')
+        config[-1:-1] = sys_mac_snippet
 
     return config
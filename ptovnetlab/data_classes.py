@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List
 
-@dataclass
+@dataclass(slots=True)
 class Switch:
     """Represents a switch being modeled in the virtual lab."""
     name: str  # Switch name received as input argument
@@ -18,7 +18,11 @@ class Switch:
     vendor_platform: str = ''  # Switch vendor/platform (optional)
     qemu_vm_id: str = ''  # QEMU VM ID (optional)
 
-@dataclass
+    def encoded_config(self) -> bytes:
+        """Return initial_config as newline-terminated ASCII bytes."""
+        return ('\n'.join(self.initial_config) + '\n').encode('ascii')
+
+@dataclass(slots=True)
 class Connection:
     """Represents a connection between two switches in the virtual lab."""
     switch_a: str  # LLDP system name of the first switch
@@ -8,15 +8,20 @@ configuration, and network infrastructure setup.
 """
 
 import asyncio
+import contextlib
+import functools
+import gzip
 import logging
+import re
 from io import BytesIO
 import tarfile
-from typing import List, Dict, Optional, Union, Tuple, Any
+from typing import Any, AsyncIterator, List, Optional, Tuple
 
 import aiohttp
-import aiodocker
-from aiodocker import Docker as docker
 
+from ptovnetlab._runtime import (
+    json_dumps, json_loads, make_resolver, run_event_loop
+)
 from ptovnetlab.data_classes import Switch, Connection
 
 # Configure logging
@@ -26,6 +31,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Default upper bound on simultaneous requests to the GNS3 server, and on
+# simultaneous config pushes to its Docker daemon
+GNS3_MAX_CONCURRENCY = 10
+# Minimum size of the connection pool to the GNS3 server; requests are
+# already bounded by the concurrency limit, so this only needs a little headroom
+GNS3_CONNECTION_LIMIT = 16
+# Minimum size of the connection pool to the Docker daemon
+DOCKER_CONNECTION_LIMIT = 32
+# Chunk size used when streaming archives to the Docker API
+ARCHIVE_CHUNK_SIZE = 65536
+# gzip level for config archives; level 1 gets most of the size reduction
+# on text configs at a fraction of the CPU cost of higher levels
+ARCHIVE_COMPRESSLEVEL = 1
+# Node layout on the GNS3 project canvas
+NODE_X_MIN, NODE_X_MAX, NODE_X_STEP = -825, 400, 150
+NODE_Y_MIN, NODE_Y_STEP = -375, 200
+NODES_PER_ROW = (NODE_X_MAX - NODE_X_MIN) // NODE_X_STEP + 1
+# ustar header for the config archive's 'startup-config' entry; only its
+# size and checksum fields differ between switches
+_CONFIG_TAR_HEADER = tarfile.TarInfo('startup-config').tobuf(tarfile.USTAR_FORMAT)
+# Adapter number of an 'EthernetN[/M...]' port name
+_ETHER_PORT_RE = re.compile(r'ethernet(\d+)', re.IGNORECASE)
+
 class GNS3WorkerError(Exception):
     """Custom exception for GNS3 Worker related errors."""
     pass
@@ -39,7 +67,8 @@ def invoker(
     gns3_url: str, 
     switches: List[Switch],
     prj_id: str, 
-    connections: List[Connection]
+    connections: List[Connection],
+    max_concurrency: int = GNS3_MAX_CONCURRENCY
 ) -> str:
     """
     Synchronous entry point for creating GNS3 project nodes and connections.
@@ -53,6 +82,8 @@ def invoker(
         switches (List[Switch]): List of Switch objects to be emulated
         prj_id (str): The GNS3 project ID
         connections (List[Connection]): List of connections to make between nodes
+        max_concurrency (int): Upper bound on simultaneous GNS3 requests and
+            on simultaneous config pushes
 
     Returns:
         str: Status message indicating completion or error
@@ -62,8 +93,11 @@ def invoker(
     """
     try:
         logger.info('Initiating GNS3 project node and connection creation')
-        result = asyncio.run(
-            main_job(servername, gns3_url, switches, prj_id, connections)
+        result = run_event_loop(
+            main_job(
+                servername, gns3_url, switches, prj_id, connections,
+                max_concurrency
+            )
         )
         logger.info('GNS3 project setup completed successfully')
         return result
@@ -76,7 +110,8 @@ async def main_job(
     gns3_url: str, 
     switches: List[Switch],
     prj_id: str, 
-    connections: List[Connection]
+    connections: List[Connection],
+    max_concurrency: int = GNS3_MAX_CONCURRENCY
 ) -> str:
     """
     Asynchronously create GNS3 nodes, configure containers, and establish connections.
@@ -87,10 +122,24 @@ async def main_job(
         switches (List[Switch]): List of Switch objects to be emulated
         prj_id (str): The GNS3 project ID
         connections (List[Connection]): List of connections to make between nodes
+        max_concurrency (int): Upper bound on simultaneous GNS3 requests and
+            on simultaneous config pushes
 
     Returns:
         str: Status message indicating completion
+
+    Raises:
+        GNS3WorkerError: If max_concurrency is not a positive integer
+        ContainerConfigurationError: If any switch's startup config could
+            not be written to its container
     """
+    # Semaphore(0) would never let a request through, so reject it (and
+    # anything else unusable as a bound) before any session is opened
+    if not isinstance(max_concurrency, int) or max_concurrency < 1:
+        raise GNS3WorkerError(
+            f"max_concurrency must be a positive integer, not {max_concurrency!r}"
+        )
+
     logger.info('Creating nodes in the GNS3 project.')
     
     # Configure session timeout
@@ -101,199 +150,340 @@ async def main_job(
         sock_read=timeout_seconds
     )
 
-    async with aiohttp.ClientSession(timeout=session_timeout) as session:
-        # Position nodes in the project
-        nodex, nodey = -825, -375
-
-        # Create nodes
-        async with asyncio.TaskGroup() as tg1:
-            node_tasks = []
-            for switch in switches:
-                task = tg1.create_task(
-                    make_a_gns3_node(
-                        switch, session, gns3_url, nodex, nodey, prj_id
-                    )
-                )
-                node_tasks.append(task)
-                
-                # Update node positioning
-                nodex += 150
-                if nodex > 400:
-                    nodex = -800
-                    nodey += 200
-
-        # Update switches with node information
-        switches = [await task for task in node_tasks]
-
-        # Configure Docker containers
-        docker_client = aiodocker.Docker(url=f"http://{servername}:2375")
-        try:
-            async with asyncio.TaskGroup() as tg2:
-                config_tasks = []
-                for switch in switches:
-                    task = tg2.create_task(
-                        docker_api_config(switch, docker_client, servername)
+    # Size the connection pool explicitly and cache the server's DNS lookup,
+    # resolving through aiodns instead of the thread pool when it is installed
+    connector = aiohttp.TCPConnector(
+        limit=max(GNS3_CONNECTION_LIMIT, max_concurrency),
+        limit_per_host=max(GNS3_CONNECTION_LIMIT, max_concurrency),
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+        resolver=make_resolver()
+    )
+
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=session_timeout, json_serialize=json_dumps
+    ) as session:
+        make_link_url = f"{gns3_url}projects/{prj_id}/links"
+        # Bound concurrent GNS3 API requests across every switch and link, and
+        # concurrent config pushes, so a large lab doesn't swamp the server
+        gns3_semaphore = asyncio.Semaphore(max_concurrency)
+        docker_semaphore = asyncio.Semaphore(max_concurrency)
+
+        # One TaskGroup drives the whole build: each switch's config push and
+        # each link start as soon as the node(s) they depend on exist, rather
+        # than waiting for every node (and then every config push) to finish.
+        # A single Docker API session is shared by every switch's config push,
+        # with idle connections kept for a minute so later uploads reuse them.
+        # The daemon is local or on the LAN, so ask it not to compress
+        # responses.
+        docker_connector = aiohttp.TCPConnector(
+            limit=max(DOCKER_CONNECTION_LIMIT, max_concurrency),
+            limit_per_host=max(DOCKER_CONNECTION_LIMIT, max_concurrency),
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            resolver=make_resolver()
+        )
+        async with aiohttp.ClientSession(
+            base_url=f"http://{servername}:2375",
+            headers={'Accept-Encoding': 'identity'},
+            timeout=session_timeout,
+            json_serialize=json_dumps,
+            connector=docker_connector
+        ) as docker_session:
+            async with asyncio.TaskGroup() as tg:
+                # Create nodes, keyed by LLDP system name for link endpoint lookup.
+                # Switches sharing a template and adapter count share a single
+                # temporary template rather than each duplicating their own.
+                node_tasks = {}
+                config_tasks = {}
+                template_tasks = {}
+                template_node_tasks = {}
+                for index, switch in enumerate(switches):
+                    template_key = (
+                        switch.gns3_template_id, switch.ethernet_interfaces + 1
                     )
-                    config_tasks.append(task)
-                
-                # Wait for configuration tasks
-                results = [await task for task in config_tasks]
-                logger.info("Configuration copying completed for all switches")
-        finally:
-            await docker_client.close()
-
-        # Establish connections between nodes
-        async with asyncio.TaskGroup() as tg3:
-            for connection in connections:
-                a_node_id, b_node_id = _find_connection_nodes(switches, connection)
-                
-                if a_node_id and b_node_id:
-                    try:
-                        a_adapter = _parse_port(connection.port_a)
-                        b_adapter = _parse_port(connection.port_b)
-
-                        make_link_url = f"{gns3_url}projects/{prj_id}/links"
-                        make_link_json = {
-                            'nodes': [
-                                {
-                                    'adapter_number': int(a_adapter),
-                                    'node_id': a_node_id, 
-                                    'port_number': 0
-                                },
-                                {
-                                    'adapter_number': int(b_adapter),
-                                    'node_id': b_node_id, 
-                                    'port_number': 0
-                                }
-                            ]
-                        }
-
-                        tg3.create_task(
-                            gns3_post(
-                                session, 
-                                str(make_link_url), 
-                                'post', 
-                                jsondata=make_link_json
+                    if template_key not in template_tasks:
+                        template_tasks[template_key] = tg.create_task(
+                            make_tmp_template(
+                                session, gns3_url, *template_key, gns3_semaphore
                             )
                         )
-                    except ValueError as e:
-                        logger.error(
-                            f"Error parsing ports for connection "
-                            f"{connection.switch_a}:{connection.port_a} -> "
-                            f"{connection.switch_b}:{connection.port_b}: {e}"
+                        template_node_tasks[template_key] = []
+
+                    node_task = tg.create_task(
+                        _node_when_ready(
+                            template_tasks[template_key],
+                            switch, session, gns3_url, *_node_position(index), prj_id,
+                            gns3_semaphore
                         )
+                    )
+                    node_tasks[switch.lldp_system_name] = node_task
+                    template_node_tasks[template_key].append(node_task)
+
+                    # Configure the Docker container once its node exists
+                    config_tasks[switch.name] = tg.create_task(
+                        _configure_when_ready(
+                            node_task, docker_session, docker_semaphore
+                        )
+                    )
+
+                # Delete each temporary template once all its nodes exist
+                for template_key, group_tasks in template_node_tasks.items():
+                    tg.create_task(
+                        _delete_template_when_done(
+                            session, gns3_url, gns3_semaphore,
+                            template_tasks[template_key], group_tasks
+                        )
+                    )
+
+                # Establish connections between nodes
+                for connection in connections:
+                    a_node_task = node_tasks.get(connection.switch_a)
+                    b_node_task = node_tasks.get(connection.switch_b)
+
+                    if a_node_task and b_node_task:
+                        try:
+                            a_adapter = _parse_port(connection.port_a)
+                            b_adapter = _parse_port(connection.port_b)
+                        except ValueError as e:
+                            logger.error(
+                                f"Error parsing ports for connection "
+                                f"{connection.switch_a}:{connection.port_a} -> "
+                                f"{connection.switch_b}:{connection.port_b}: {e}"
+                            )
+                            continue
+
+                        tg.create_task(
+                            _link_when_ready(
+                                session,
+                                make_link_url,
+                                gns3_semaphore,
+                                (a_node_task, a_adapter),
+                                (b_node_task, b_adapter)
+                            )
+                        )
+
+            logger.info("Nodes, configurations and links completed for all switches")
+
+        # A failed config push doesn't stop the rest of the build, but the
+        # lab isn't ready to run with switches missing their startup config
+        failed = [
+            f'{name} ({task.result()})'
+            for name, task in config_tasks.items()
+            if task.result().startswith('failed')
+        ]
+        if failed:
+            raise ContainerConfigurationError(
+                f"Startup config not written for: {', '.join(failed)}"
+            )
 
         return "Virtual Network Lab is ready to run."
 
-def _find_connection_nodes(
-    switches: List[Switch], 
-    connection: Connection
-) -> Tuple[Optional[str], Optional[str]]:
+def _node_position(index: int) -> Tuple[int, int]:
     """
-    Find node IDs for a given connection.
+    Compute a node's (x, y) position in the project from its index.
+
+    Nodes are laid out in rows from left to right, as many to a row as fit
+    between NODE_X_MIN and NODE_X_MAX, so each position depends only on the
+    index and not on any previously placed node.
 
     Args:
-        switches (List[Switch]): List of switches
-        connection (Connection): Connection to find nodes for
+        index (int): Position of the switch in the switch list
 
     Returns:
-        Tuple[Optional[str], Optional[str]]: Node IDs for switches A and B
+        Tuple[int, int]: X and Y coordinates for the node
     """
-    a_node_id = next(
-        (switch.gns3_node_id for switch in switches 
-         if switch.lldp_system_name == connection.switch_a), 
-        None
+    row, col = divmod(index, NODES_PER_ROW)
+    return NODE_X_MIN + NODE_X_STEP * col, NODE_Y_MIN + NODE_Y_STEP * row
+
+async def _node_when_ready(
+    template_task: asyncio.Task[str],
+    switch: Switch, 
+    session: aiohttp.ClientSession, 
+    gns3_url: str, 
+    nodex: int, 
+    nodey: int, 
+    prj_id: str,
+    semaphore: asyncio.Semaphore
+) -> Switch:
+    """
+    Create a switch's GNS3 node once its temporary template exists.
+
+    Args:
+        template_task (asyncio.Task[str]): Task creating the temporary template
+        switch (Switch): Switch to create a node for
+        session (aiohttp.ClientSession): Async HTTP session
+        gns3_url (str): Base URL for GNS3 API
+        nodex (int): X coordinate for node placement
+        nodey (int): Y coordinate for node placement
+        prj_id (str): GNS3 project ID
+        semaphore (asyncio.Semaphore): Bounds concurrent requests to the server
+
+    Returns:
+        Switch: Updated switch with GNS3 node details
+    """
+    tmp_template_id = await template_task
+    return await make_a_gns3_node(
+        switch, session, gns3_url, tmp_template_id, nodex, nodey, prj_id, semaphore
     )
-    b_node_id = next(
-        (switch.gns3_node_id for switch in switches 
-         if switch.lldp_system_name == connection.switch_b), 
-        None
+
+async def _delete_template_when_done(
+    session: aiohttp.ClientSession, 
+    gns3_url: str, 
+    semaphore: asyncio.Semaphore,
+    template_task: asyncio.Task[str],
+    node_tasks: List[asyncio.Task[Switch]]
+) -> None:
+    """
+    Delete a temporary template once every node built from it has been created.
+
+    Args:
+        session (aiohttp.ClientSession): Async HTTP session
+        gns3_url (str): Base URL for GNS3 API
+        semaphore (asyncio.Semaphore): Bounds concurrent requests to the server
+        template_task (asyncio.Task[str]): Task creating the temporary template
+        node_tasks (List[asyncio.Task[Switch]]): Tasks creating nodes from it
+    """
+    tmp_template_id = await template_task
+    await asyncio.wait(node_tasks)
+    try:
+        await gns3_post(
+            session, f'{gns3_url}templates/{tmp_template_id}', 'delete', semaphore
+        )
+    except GNS3WorkerError:
+        # A leftover template does not affect the lab, so don't fail the build
+        logger.warning(f"Could not delete temporary template {tmp_template_id}")
+
+async def _configure_when_ready(
+    node_task: asyncio.Task[Switch],
+    docker_session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore
+) -> str:
+    """
+    Push a switch's startup configuration once its GNS3 node has been created.
+
+    Args:
+        node_task (asyncio.Task[Switch]): Task creating the switch's GNS3 node
+        docker_session (aiohttp.ClientSession): Session bound to the Docker API
+        semaphore (asyncio.Semaphore): Bounds concurrent config pushes
+
+    Returns:
+        str: Configuration status
+    """
+    switch = await node_task
+    async with semaphore:
+        return await docker_api_config(switch, docker_session)
+
+async def _link_when_ready(
+    session: aiohttp.ClientSession,
+    make_link_url: str,
+    semaphore: asyncio.Semaphore,
+    a_end: Tuple[asyncio.Task[Switch], int],
+    b_end: Tuple[asyncio.Task[Switch], int]
+) -> None:
+    """
+    Create a GNS3 link once the nodes at both of its ends have been created.
+
+    Args:
+        session (aiohttp.ClientSession): Async HTTP session
+        make_link_url (str): GNS3 URL for creating links in the project
+        semaphore (asyncio.Semaphore): Bounds concurrent requests to the server
+        a_end (Tuple[asyncio.Task[Switch], int]): Node task and adapter number
+            for the first end of the link
+        b_end (Tuple[asyncio.Task[Switch], int]): Node task and adapter number
+            for the second end of the link
+    """
+    # Both node tasks must finish; awaiting them in turn avoids building a
+    # gather() future for every link
+    a_switch = await a_end[0]
+    b_switch = await b_end[0]
+    make_link_json = {
+        'nodes': [
+            {
+                'adapter_number': a_end[1],
+                'node_id': a_switch.gns3_node_id, 
+                'port_number': 0
+            },
+            {
+                'adapter_number': b_end[1],
+                'node_id': b_switch.gns3_node_id, 
+                'port_number': 0
+            }
+        ]
+    }
+    await gns3_post(
+        session, 
+        make_link_url, 
+        'post', 
+        semaphore,
+        jsondata=make_link_json
     )
-    return a_node_id, b_node_id
 
-def _parse_port(port: str) -> str:
+@functools.lru_cache(maxsize=4096)
+def _parse_port(port: str) -> int:
     """
     Parse port string to extract adapter number.
 
+    The same port names recur across switches, so results are memoized.
+
     Args:
         port (str): Port string (e.g., 'Ethernet1/1')
 
     Returns:
-        str: Extracted adapter number
+        int: Extracted adapter number
 
     Raises:
         ValueError: If port format is invalid
     """
-    if not port.lower().startswith('ethernet'):
-        raise ValueError(f"Invalid port format: {port}. Port must start with 'ethernet'")
-    
-    # Extract numbers after 'ethernet', before any '/'
-    port_base = port.lower().split('/')[0]
-    adapter_num = ''.join(filter(str.isdigit, port_base))
-    
-    if not adapter_num:
-        raise ValueError(f"Could not extract adapter number from port: {port}")
-    
-    return adapter_num
+    # Extract the number after a leading 'ethernet', before any '/'
+    match = _ETHER_PORT_RE.match(port)
+    if not match:
+        raise ValueError(
+            f"Invalid port format: {port}. Port must be 'ethernet' followed by a number"
+        )
+
+    return int(match.group(1))
 
 async def docker_api_config(
     switch: Switch, 
-    docker_client: aiodocker.Docker, 
-    servername: str = 'localhost'
+    session: aiohttp.ClientSession
 ) -> str:
     """
     Configure Docker container with switch startup configuration.
 
+    The archive is written into the node's container while it is still
+    stopped; the Docker daemon can extract into a created container's
+    filesystem and volumes, and the switch reads the config when GNS3
+    starts the node.
+
     Args:
         switch (Switch): Switch object containing configuration
-        docker_client (aiodocker.Docker): Docker client for API interactions
-        servername (str, optional): Docker daemon hostname. Defaults to 'localhost'.
+        session (aiohttp.ClientSession): Session bound to the Docker API
+            (base_url of the Docker daemon), shared across switches
 
     Returns:
-        str: Configuration status
+        str: Configuration status: 'success', 'skipped - empty config', or
+        'failed - <reason>' (main_job raises for any failed push)
     """
     try:
-        logger.info(f"Starting configuration for switch {switch.name}")
+        logger.debug("Starting configuration for switch %s", switch.name)
         
         # Validate configuration
         if not switch.initial_config:
             logger.warning(f"Empty configuration for switch {switch.name}")
             return 'skipped - empty config'
 
-        # Prepare configuration string
-        config_string = '\n'.join(switch.initial_config)
-        ascii_config = config_string.encode('ascii')
-        
-        # Create tar archive
-        fh = BytesIO()
-        with tarfile.open(fileobj=fh, mode='w') as tarch:
-            info = tarfile.TarInfo('startup-config')
-            info.size = len(ascii_config)
-            bytes_to_go = BytesIO(ascii_config)
-            tarch.addfile(info, bytes_to_go)
+        # Create tar archive, rewound so it can be streamed to the Docker API
+        fh = _build_config_archive(switch.encoded_config())
         
-        fh.seek(0)
-        archive_content = fh.read()
-        
-        logger.info(f"Configuration archive created for {switch.name}")
-
-        # Async Docker API session
-        async with aiohttp.ClientSession(base_url=f"http://{servername}:2375") as session:
-            # Start container
-            await _start_container(session, switch.docker_container_id)
-            
-            # Copy configuration to container
-            await _copy_config_to_container(
-                session, 
-                switch.docker_container_id, 
-                archive_content
-            )
-            
-            # Move configuration file
-            await _move_config_file(session, switch.docker_container_id)
-            
-            # Stop container
-            await _stop_container(session, switch.docker_container_id)
+        logger.debug("Configuration archive created for %s", switch.name)
+
+        # Copy configuration to container
+        await _copy_config_to_container(
+            session, 
+            switch.docker_container_id, 
+            fh
+        )
 
         logger.info(f"Successfully configured switch {switch.name}")
         return 'success'
@@ -302,232 +492,242 @@ async def docker_api_config(
         logger.error(f"Error configuring switch {switch.name}: {e}")
         return f'failed - {str(e)}'
 
-async def _start_container(session: aiohttp.ClientSession, container_id: str) -> None:
+def _build_config_archive(ascii_config: bytes) -> BytesIO:
     """
-    Start a Docker container.
+    Pack a startup-config into an in-memory, gzip-compressed tar archive.
+
+    The archive is one ustar header block, the payload padded to a whole
+    block and two end-of-archive blocks, joined into a single buffer without
+    going through a TarFile object.  The header is a copy of
+    _CONFIG_TAR_HEADER with its size and checksum fields filled in.  The
+    Docker daemon recognises gzip archives by their content, so the upload
+    needs no extra headers.
 
     Args:
-        session (aiohttp.ClientSession): Async HTTP session
-        container_id (str): Docker container ID
+        ascii_config (bytes): Encoded startup-config
 
-    Raises:
-        ContainerConfigurationError: If container start fails
+    Returns:
+        BytesIO: Compressed tar archive holding 'startup-config', positioned
+            at its start
     """
-    async with session.post(f"/containers/{container_id}/start") as response:
-        if response.status not in [204, 304]:
-            raise ContainerConfigurationError(
-                f"Could not start container. Status: {response.status}"
-            )
-    
-    # Wait for container to be ready
-    start_time = asyncio.get_event_loop().time()
-    while asyncio.get_event_loop().time() - start_time < 20:
-        async with session.get(f"/containers/{container_id}/json") as response:
-            if response.status == 200:
-                container_info = await response.json()
-                if container_info['State']['Running']:
-                    return
-        await asyncio.sleep(1)
-    
-    raise ContainerConfigurationError(f"Container {container_id} did not become ready")
+    header = bytearray(_CONFIG_TAR_HEADER)
+    header[124:136] = b'%011o\0' % len(ascii_config)
+    # The checksum is summed with its own field set to spaces
+    header[148:156] = b' ' * 8
+    header[148:155] = b'%06o\0' % sum(header)
+    padding = -len(ascii_config) % tarfile.BLOCKSIZE + 2 * tarfile.BLOCKSIZE
+    archive = b''.join((header, ascii_config, bytes(padding)))
+    return BytesIO(gzip.compress(archive, compresslevel=ARCHIVE_COMPRESSLEVEL, mtime=0))
 
 async def _copy_config_to_container(
     session: aiohttp.ClientSession, 
     container_id: str, 
-    archive_content: bytes
+    archive: BytesIO
 ) -> None:
     """
-    Copy configuration archive to container.
+    Copy configuration archive into the container's /mnt/flash directory.
+
+    The archive is streamed in chunks with an explicit Content-Length, so the
+    Docker daemon receives it without chunked transfer encoding.
 
     Args:
         session (aiohttp.ClientSession): Async HTTP session
         container_id (str): Docker container ID
-        archive_content (bytes): Configuration archive content
+        archive (BytesIO): Configuration tar archive, positioned at its start
 
     Raises:
         ContainerConfigurationError: If file copy fails
     """
-    headers = {'Content-Type': 'application/x-tar'}
+    headers = {
+        'Content-Type': 'application/x-tar',
+        'Content-Length': str(archive.getbuffer().nbytes - archive.tell())
+    }
     async with session.put(
         f"/containers/{container_id}/archive",
-        params={'path': '/'},
+        params={'path': '/mnt/flash/'},
         headers=headers,
-        data=archive_content
+        data=_iter_chunks(archive)
     ) as response:
         if response.status != 200:
             raise ContainerConfigurationError(
                 f"Error copying configuration. Status: {response.status}"
             )
+        await response.read()
 
-async def _move_config_file(
-    session: aiohttp.ClientSession, 
-    container_id: str
-) -> None:
+async def _iter_chunks(
+    buf: BytesIO, 
+    chunk_size: int = ARCHIVE_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
     """
-    Move configuration file to correct location in container.
+    Yield the rest of a buffer in fixed-size chunks for a streaming upload.
 
     Args:
-        session (aiohttp.ClientSession): Async HTTP session
-        container_id (str): Docker container ID
+        buf (BytesIO): Buffer to read from its current position
+        chunk_size (int): Maximum size of each chunk
 
-    Raises:
-        ContainerConfigurationError: If file move fails
+    Yields:
+        bytes: Next chunk of the buffer
     """
-    # Create exec instance for mv command
-    async with session.post(
-        f"/containers/{container_id}/exec",
-        json={
-            "AttachStdout": True,
-            "AttachStderr": True,
-            "Cmd": ["mv", "/startup-config", "/mnt/flash/"]
-        }
-    ) as response:
-        if response.status != 201:
-            raise ContainerConfigurationError(
-                f"Could not create mv exec. Status: {response.status}"
-            )
-        
-        exec_data = await response.json()
-        exec_id = exec_data['Id']
-
-        # Start exec instance
-        async with session.post(
-            f"/exec/{exec_id}/start",
-            json={"Detach": False, "Tty": False},
-            headers={'Content-Type': 'application/json'}
-        ) as exec_response:
-            if exec_response.status != 200:
-                raise ContainerConfigurationError(
-                    f"mv command exec failed. Status: {exec_response.status}"
-                )
-
-async def _stop_container(
+    chunk = buf.read(chunk_size)
+    while chunk:
+        yield chunk
+        chunk = buf.read(chunk_size)
+
+async def make_tmp_template(
     session: aiohttp.ClientSession, 
-    container_id: str
-) -> None:
+    gns3_url: str, 
+    template_id: str, 
+    adapters: int,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> str:
     """
-    Stop a Docker container.
+    Duplicate a GNS3 template and set the duplicate's adapter count.
 
     Args:
         session (aiohttp.ClientSession): Async HTTP session
-        container_id (str): Docker container ID
+        gns3_url (str): Base URL for GNS3 API
+        template_id (str): ID of the template to duplicate
+        adapters (int): Number of adapters for the duplicate
+        semaphore (asyncio.Semaphore, optional): Bounds concurrent requests
+            to the server
+
+    Returns:
+        str: ID of the temporary template
 
     Raises:
-        ContainerConfigurationError: If container stop fails
+        GNS3WorkerError: If a GNS3 API request fails
     """
-    async with session.post(f"/containers/{container_id}/stop") as response:
-        if response.status not in [204, 304]:
-            raise ContainerConfigurationError(
-                f"Could not stop container. Status: {response.status}"
-            )
+    # Duplicate template
+    json_data = await gns3_post(
+        session, f'{gns3_url}templates/{template_id}/duplicate', 'post', semaphore
+    )
+    tmp_template_id = json_data['template_id']
+
+    # Update interface count
+    await gns3_post(
+        session, f'{gns3_url}templates/{tmp_template_id}', 'put', semaphore,
+        jsondata={'adapters': adapters}
+    )
+
+    return tmp_template_id
 
 async def make_a_gns3_node(
     switch: Switch, 
     session: aiohttp.ClientSession, 
     gns3_url: str, 
+    tmp_template_id: str, 
     nodex: int, 
     nodey: int, 
-    prj_id: str
+    prj_id: str,
+    semaphore: Optional[asyncio.Semaphore] = None
 ) -> Switch:
     """
     Create a GNS3 node for a switch.
 
+    The requests for one switch are sequential; the semaphore, when given,
+    bounds how many are in flight across all switches.
+
     Args:
         switch (Switch): Switch to create a node for
         session (aiohttp.ClientSession): Async HTTP session
         gns3_url (str): Base URL for GNS3 API
+        tmp_template_id (str): Temporary template sized for the switch
         nodex (int): X coordinate for node placement
         nodey (int): Y coordinate for node placement
         prj_id (str): GNS3 project ID
+        semaphore (asyncio.Semaphore, optional): Bounds concurrent requests
+            to the server
 
     Returns:
         Switch: Updated switch with GNS3 node details
+
+    Raises:
+        GNS3WorkerError: If a GNS3 API request fails
     """
+    project_url = f'{gns3_url}projects/{prj_id}'
+    template_url = f'{project_url}/templates/{tmp_template_id}'
+
+    # Create the node already named; servers that reject a name when
+    # creating a node from a template (400 Bad Request) get it in a separate
+    # rename request.  Any other failure may have left a node behind, so it
+    # is not retried.
     try:
-        # Duplicate template
-        async with session.post(
-            f'{gns3_url}templates/{switch.gns3_template_id}/duplicate', 
-            json=[]
-        ) as response:
-            response.raise_for_status()
-            json_data = await response.json()
-            tmp_template_id = json_data['template_id']
-
-        # Update interface count
-        async with session.put(
-            f'{gns3_url}templates/{tmp_template_id}', 
-            json={'adapters': switch.ethernet_interfaces + 1}
-        ) as response:
-            response.raise_for_status()
-
-        # Create node
-        async with session.post(
-            f'{gns3_url}projects/{prj_id}/templates/{tmp_template_id}', 
-            json={'x': nodex, 'y': nodey}
-        ) as response:
-            response.raise_for_status()
-            json_data = await response.json()
-            switch.gns3_node_id = json_data['node_id']
-
-        # Delete temporary template
-        async with session.delete(f'{gns3_url}templates/{tmp_template_id}'):
-            pass
-
-        # Rename node
-        async with session.put(
-            f'{gns3_url}projects/{prj_id}/nodes/{switch.gns3_node_id}', 
-            json={'name': switch.name}
-        ) as response:
-            response.raise_for_status()
-
-        # Get container ID
-        async with session.get(
-            f'{gns3_url}projects/{prj_id}/nodes/{switch.gns3_node_id}'
-        ) as response:
-            response.raise_for_status()
-            json_data = await response.json()
-            switch.docker_container_id = json_data['properties']['container_id']
-
-        return switch
+        json_data = await gns3_post(
+            session, template_url, 'post',
+            semaphore, expected_status=400,
+            jsondata={'x': nodex, 'y': nodey, 'name': switch.name}
+        )
+        switch.gns3_node_id = json_data['node_id']
+    except GNS3WorkerError as e:
+        cause = e.__cause__
+        if not (isinstance(cause, aiohttp.ClientResponseError) and cause.status == 400):
+            raise
+        logger.debug(f"Creating {switch.name} without a name, then renaming it")
+        json_data = await gns3_post(
+            session, template_url, 'post',
+            semaphore, jsondata={'x': nodex, 'y': nodey}
+        )
+        switch.gns3_node_id = json_data['node_id']
+        json_data = await gns3_post(
+            session, f'{project_url}/nodes/{switch.gns3_node_id}', 'put',
+            semaphore, jsondata={'name': switch.name}
+        )
 
-    except aiohttp.ClientResponseError as e:
-        logger.error(f"GNS3 node creation failed: {e}")
-        raise GNS3WorkerError(f"Failed to create GNS3 node: {e}")
+    # The node's properties normally carry the container ID already; only
+    # fetch the node again if they don't
+    container_id = (json_data.get('properties') or {}).get('container_id')
+    if not container_id:
+        json_data = await gns3_post(
+            session, f'{project_url}/nodes/{switch.gns3_node_id}', 'get',
+            semaphore
+        )
+        container_id = json_data['properties']['container_id']
+    switch.docker_container_id = container_id
+
+    return switch
 
 async def gns3_post(
     session: aiohttp.ClientSession, 
     url: str, 
     method: str, 
+    semaphore: Optional[asyncio.Semaphore] = None,
+    expected_status: Optional[int] = None,
     **kwargs
-) -> None:
+) -> Any:
     """
     Send an async request to GNS3 server.
 
+    This is the single path for GNS3 API calls in this module: any non-2xx
+    response is raised as a GNS3WorkerError.
+
     Args:
         session (aiohttp.ClientSession): Async HTTP session
         url (str): URL to send request to
-        method (str): HTTP method (get, post, put)
-        **kwargs: Additional arguments for the request
+        method (str): HTTP method (get, post, put, delete)
+        semaphore (asyncio.Semaphore, optional): Bounds concurrent requests
+            to the server; requests are not limited when omitted
+        expected_status (int, optional): Error status the caller handles
+            itself; it is still raised, but logged at debug level only
+        **kwargs: Additional arguments for the request; 'jsondata' is sent as
+            the JSON body (no body is sent when it is omitted)
+
+    Returns:
+        Any: Parsed JSON response body, or None if the body is empty
 
     Raises:
         GNS3WorkerError: If request fails
     """
     try:
-        jsondata = kwargs.get('jsondata', {})
-        
-        if method == 'post':
-            async with session.post(url, json=jsondata) as response:
-                response.raise_for_status()
-        elif method == 'get':
-            async with session.get(url, json=jsondata) as response:
+        async with semaphore or contextlib.nullcontext():
+            async with session.request(
+                method.upper(), url, json=kwargs.get('jsondata')
+            ) as response:
                 response.raise_for_status()
-        elif method == 'put':
-            async with session.put(url, json=jsondata) as response:
-                response.raise_for_status()
-        
-        # Small delay to prevent overwhelming the server
-        await asyncio.sleep(0.2)
+                return await response.json(loads=json_loads, content_type=None)
 
     except aiohttp.ClientResponseError as e:
-        logger.error(f"GNS3 API request failed: {e}")
-        raise GNS3WorkerError(f"API request failed: {e}")
+        if e.status == expected_status:
+            logger.debug(f"GNS3 API request failed as expected: {e}")
+        else:
+            logger.error(f"GNS3 API request failed: {e}")
+        raise GNS3WorkerError(f"API request failed: {e}") from e
@@ -3,13 +3,17 @@
 This module converts physical network switch configurations into a GNS3 virtual lab.
 """
 
+import asyncio
 import sys
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 from getpass import getpass
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from ptovnetlab import arista_poller, arista_sanitizer, gns3_worker
+from ptovnetlab._runtime import run_event_loop
 from ptovnetlab.data_classes import Switch, Connection
 
 # Custom Exceptions
@@ -32,6 +36,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Seconds to wait on each GNS3 setup request
+GNS3_REQUEST_TIMEOUT = 20
+# Retries for GNS3 setup requests that fail to connect or return a transient
+# 5xx; urllib3's default method list leaves the project-creating POST out, so
+# a retry can never create a second project
+GNS3_REQUEST_RETRY = Retry(
+    total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504]
+)
+
 def validate_input(
     filename: Optional[str] = None, 
     switchlist: Optional[List[str]] = None, 
@@ -81,7 +94,7 @@ def collect_switch_list(
     if filename:
         try:
             with open(filename, 'r') as f:
-                return [line.strip() for line in f if line.strip()]
+                return [name for line in f if (name := line.strip())]
         except IOError as e:
             raise InputValidationError(f"Error reading switch list file: {e}")
     
@@ -125,8 +138,7 @@ def process_switch_configurations(
         Processed switches and connections
     """
     # Sanitize configurations
-    for switch in switches:
-        switch = arista_sanitizer.eos_to_ceos(switch)
+    switches = [arista_sanitizer.eos_to_ceos(switch) for switch in switches]
 
     # Filter connections involving only the current switches
     our_lldp_ids = {switch.lldp_system_name for switch in switches}
@@ -135,16 +147,12 @@ def process_switch_configurations(
         if conn.switch_a in our_lldp_ids and conn.switch_b in our_lldp_ids
     ]
 
-    # Remove duplicate connections
+    # Remove duplicate connections (each link is reported from both ends)
+    seen = set()
     unique_connections = []
     for conn in connections:
-        if not any(
-            c.switch_a == conn.switch_b and 
-            c.switch_b == conn.switch_a and
-            c.port_a == conn.port_b and 
-            c.port_b == conn.port_a 
-            for c in unique_connections
-        ):
+        if (conn.switch_b, conn.port_b, conn.switch_a, conn.port_a) not in seen:
+            seen.add((conn.switch_a, conn.port_a, conn.switch_b, conn.port_b))
             unique_connections.append(conn)
 
     # Clean management interfaces
@@ -154,47 +162,40 @@ def process_switch_configurations(
 
     return switches, unique_connections
 
-def p_to_v(**kwargs) -> str:
+def _gns3_setup_session() -> requests.Session:
     """
-    Convert physical network to virtual lab.
-
-    Args:
-        **kwargs: Flexible keyword arguments for configuration
+    Create the HTTP session used for the GNS3 setup requests.
 
     Returns:
-        URL to the created GNS3 project
+        requests.Session: Session carrying the GNS3 credentials, with
+        GNS3_REQUEST_RETRY applied to its requests
     """
-    try:
-        # Extract and validate inputs
-        filename = kwargs.get('filename', '')
-        switchlist = kwargs.get('switchlist', [])
-        username = kwargs.get('username', '')
-        passwd = kwargs.get('passwd', '')
-        servername = kwargs.get('servername', '')
-        prj_name = kwargs.get('prjname', '')
-        run_type = kwargs.get('runtype', 'module')
-
-        validate_input(filename, switchlist, prj_name, servername)
-        
-        # Collect switch list
-        switchlist = collect_switch_list(filename, switchlist)
-        
-        # Authenticate if credentials not provided
-        if not (username and passwd):
-            username, passwd = authenticate_switches()
+    session = requests.Session()
+    session.auth = ('admin', 'admin')
+    session.mount('http://', HTTPAdapter(max_retries=GNS3_REQUEST_RETRY))
+    return session
 
-        # Poll switch configurations
-        switches, connections = arista_poller.invoker(switchlist, username, passwd, run_type)
-        
-        # Process switch configurations
-        switches, connections = process_switch_configurations(switches, connections)
+def _create_gns3_project(
+    gns3_url: str, 
+    switches: List[Switch], 
+    prj_name: str
+) -> str:
+    """
+    Map switches to GNS3 templates and create the project to build them in.
 
-        # Set GNS3 URLs
-        gns3_url = f'http://{servername}:3080/v2/'
-        gns3_url_noapi = f'http://{servername}:3080/static/web-ui/server/1/project/'
+    Args:
+        gns3_url: Base URL for the GNS3 API
+        switches: Switches to emulate; their gns3_template_id is set in place
+        prj_name: Name of the project to create
 
+    Returns:
+        ID of the new GNS3 project
+    """
+    # One keep-alive connection serves both setup requests to the server
+    with _gns3_setup_session() as gns3_session:
         # Get and map GNS3 templates
-        r = requests.get(gns3_url + 'templates', auth=('admin', 'admin'), timeout=20)
+        r = gns3_session.get(gns3_url + 'templates', timeout=GNS3_REQUEST_TIMEOUT)
+        r.raise_for_status()
         image_map = {
             x['image'].lower(): x['template_id'] 
             for x in r.json() 
@@ -203,30 +204,187 @@ def p_to_v(**kwargs) -> str:
 
         # Set template IDs for switches
         for switch in switches:
-            eos_version = 'ceos:' + switch.eos_version.lower().split('-')[0]
+            eos_version = 'ceos:' + switch.eos_version.lower().partition('-')[0]
             if eos_version in image_map:
                 switch.gns3_template_id = image_map[eos_version]
 
         # Create GNS3 project
-        gnsprj_id = requests.post(
+        r = gns3_session.post(
             gns3_url + 'projects', 
             json={'name': prj_name},
-            timeout=20
-        ).json()['project_id']
+            timeout=GNS3_REQUEST_TIMEOUT
+        )
+        r.raise_for_status()
+        return r.json()['project_id']
+
+def _max_concurrency(value: Any) -> int:
+    """
+    Convert a maxconcurrency argument to a positive int.
+
+    Args:
+        value: maxconcurrency as given, e.g. 20 or '20'
+
+    Returns:
+        The value as an int
+
+    Raises:
+        InputValidationError: If the value is not a positive integer
+    """
+    try:
+        max_concurrency = int(value)
+    except (TypeError, ValueError):
+        raise InputValidationError("maxconcurrency must be a positive integer")
+    if max_concurrency < 1:
+        raise InputValidationError("maxconcurrency must be a positive integer")
+    return max_concurrency
+
+def _resolve_args(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn p_to_v's keyword arguments into p_to_v_async's, prompting as needed.
+
+    This is the only step that reads files or prompts the user; everything
+    after it can run on an event loop.
+
+    Args:
+        kwargs: Keyword arguments passed to p_to_v
+
+    Returns:
+        Keyword arguments for p_to_v_async
+
+    Raises:
+        InputValidationError: If input parameters are invalid
+    """
+    filename = kwargs.get('filename', '')
+    switchlist = kwargs.get('switchlist', [])
+    username = kwargs.get('username', '')
+    passwd = kwargs.get('passwd', '')
+    servername = kwargs.get('servername', '')
+    prj_name = kwargs.get('prjname', '')
+    max_concurrency = kwargs.get('maxconcurrency', gns3_worker.GNS3_MAX_CONCURRENCY)
+
+    validate_input(filename, switchlist, prj_name, servername)
+
+    # Values from the command line arrive as strings
+    max_concurrency = _max_concurrency(max_concurrency)
+
+    # Collect switch list
+    switchlist = collect_switch_list(filename, switchlist)
+
+    # Authenticate if credentials not provided
+    if not (username and passwd):
+        username, passwd = authenticate_switches()
+
+    return {
+        'switchlist': switchlist,
+        'username': username,
+        'passwd': passwd,
+        'servername': servername,
+        'prjname': prj_name,
+        'runtype': kwargs.get('runtype', 'module'),
+        'maxconcurrency': max_concurrency
+    }
+
+async def p_to_v_async(
+    *,
+    switchlist: List[str],
+    username: str,
+    passwd: str,
+    servername: str,
+    prjname: str,
+    runtype: str = 'module',
+    maxconcurrency: Union[int, str] = gns3_worker.GNS3_MAX_CONCURRENCY
+) -> str:
+    """
+    Convert physical network to virtual lab, from a running event loop.
+
+    Unlike p_to_v, this never prompts for missing values, so it can be
+    awaited from other asyncio code (for example, to build several labs
+    concurrently).
+
+    Args:
+        switchlist: Names of the switches to model
+        username: Username for switch authentication
+        passwd: Password for switch authentication
+        servername: Name of the GNS3 server
+        prjname: Name of the GNS3 project to create
+        runtype: Type of polling run
+        maxconcurrency: Upper bound on simultaneous GNS3 requests and
+            config pushes; a positive int, or a string holding one
+
+    Returns:
+        URL to the created GNS3 project
+
+    Raises:
+        InputValidationError: If an argument is missing or invalid
+    """
+    try:
+        if not switchlist:
+            raise InputValidationError("At least one switch is required")
+        if not prjname:
+            raise InputValidationError("Project name is required")
+        if not servername:
+            raise InputValidationError("GNS3 server name is required")
+        if not (username and passwd):
+            raise InputValidationError("Switch username and password are required")
+        # Checked before polling, so a bad value can't leave an empty project
+        maxconcurrency = _max_concurrency(maxconcurrency)
+
+        # Poll switch configurations
+        switches, connections = await arista_poller.main(
+            switchlist, username, passwd, runtype
+        )
+
+        # Process switch configurations
+        switches, connections = process_switch_configurations(switches, connections)
+
+        # Set GNS3 URLs
+        gns3_url = f'http://{servername}:3080/v2/'
+        gns3_url_noapi = f'http://{servername}:3080/static/web-ui/server/1/project/'
+
+        # The setup requests block, so keep them off the event loop
+        gnsprj_id = await asyncio.to_thread(
+            _create_gns3_project, gns3_url, switches, prjname
+        )
 
         # Create nodes and connections
-        gns3_worker.invoker(servername, gns3_url, switches, gnsprj_id, connections)
+        await gns3_worker.main_job(
+            servername, gns3_url, switches, gnsprj_id, connections, maxconcurrency
+        )
 
-        logger.info(f"Successfully created GNS3 project: {prj_name}")
+        logger.info(f"Successfully created GNS3 project: {prjname}")
         return gns3_url_noapi + gnsprj_id
 
     except (InputValidationError, NetworkConfigurationError) as e:
         logger.error(f"Configuration error: {e}")
         raise
+    except requests.RequestException as e:
+        logger.error(f"GNS3 server request failed: {e}")
+        raise NetworkConfigurationError(f"GNS3 server request to {servername} failed: {e}")
     except Exception as e:
         logger.error(f"Unexpected error in virtual lab creation: {e}")
         raise PTovNetLabError(f"Virtual lab creation failed: {e}")
 
+def p_to_v(**kwargs) -> str:
+    """
+    Convert physical network to virtual lab.
+
+    Missing switch names and credentials are prompted for, then the lab is
+    built by running p_to_v_async on a new event loop.
+
+    Args:
+        **kwargs: Flexible keyword arguments for configuration
+
+    Returns:
+        URL to the created GNS3 project
+    """
+    try:
+        resolved = _resolve_args(kwargs)
+    except InputValidationError as e:
+        logger.error(f"Configuration error: {e}")
+        raise
+
+    return run_event_loop(p_to_v_async(**resolved))
+
 def main():
     """
     Main entry point for script execution.
@@ -234,11 +392,12 @@ def main():
     try:
         kwdict = {}
         for arg in sys.argv[1:]:
-            splarg = arg.split('=')
-            if splarg[0] == 'switchlist':
-                kwdict[splarg[0]] = splarg[1].split()
+            # Split on the first '=' only, so values (e.g. passwords) may contain '='
+            key, _, value = arg.partition('=')
+            if key == 'switchlist':
+                kwdict[key] = value.split()
             else:
-                kwdict[splarg[0]] = splarg[1]
+                kwdict[key] = value
         kwdict['runtype'] = 'script'
         p_to_v(**kwdict)
     except PTovNetLabError as e:
@@ -10,13 +10,11 @@ import sys
 if __name__ == '__main__':
     kwdict = {}
     for arg in sys.argv[1:]:
-        splarg = arg.split('=')
-        if splarg[0] == 'switchlist':
-            splargalt = []
-            for swname in splarg[1].split():
-                splargalt.append(swname)
-            kwdict[splarg[0]] = splargalt
+        # Split on the first '=' only, so values (e.g. passwords) may contain '='
+        key, _, value = arg.partition('=')
+        if key == 'switchlist':
+            kwdict[key] = value.split()
         else:
-            kwdict[splarg[0]] = splarg[1]
+            kwdict[key] = value
     kwdict['runtype'] = 'script'
     ptovnetlab.p_to_v(**kwdict)